@@ -1,11 +1,13 @@
 import asyncio
-import json
 import logging
 import os
+import time
+import zlib
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+import orjson
 from azure.eventhub import EventData
 from azure.eventhub.aio import EventHubProducerClient
 from azure.eventhub.exceptions import EventHubError
@@ -18,8 +20,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+EVENT_TYPE = "translation"
 
-@dataclass
+# Upper bound on the AMQP framing an event adds to a batch on top of its body
+# (message header, partition key annotation, application properties)
+EVENT_OVERHEAD_BYTES = 128
+
+
+@dataclass(slots=True)
 class TranslationEvent:
     """Data class for translation events"""
     translated_text: str
@@ -32,7 +40,11 @@ class TranslationEvent:
     session_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
+        """
+        Convert to dictionary for JSON serialization
+
+        The timestamp is left as a datetime; orjson serializes it natively.
+        """
         return {
             "translated_text": self.translated_text,
             "source_text": self.source_text,
@@ -42,27 +54,51 @@ class TranslationEvent:
             "translation_service": self.translation_service,
             "user_id": self.user_id,
             "session_id": self.session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "event_type": "translation"
+            "timestamp": datetime.now(timezone.utc),
+            "event_type": EVENT_TYPE
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize to the UTF-8 JSON body sent to Event Hubs"""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_UTC_Z)
+
 
 class EventHubTranslationProducer:
     """Production-ready Event Hub producer for translation streaming"""
 
-    def __init__(self, connection_string: str = None, eventhub_name: str = None):
+    def __init__(self, connection_string: str = None, eventhub_name: str = None,
+                 buffered: bool = False, max_wait_time: float = 2,
+                 max_buffer_length: int = 1000, compress: bool = False):
+        """
+        Args:
+            connection_string: Event Hub namespace connection string
+            eventhub_name: Name of the Event Hub
+            buffered: Enqueue events and let the SDK publish them in the
+                background instead of awaiting each send (live streaming)
+            max_wait_time: Buffered mode only. Seconds to wait before a
+                partially filled batch is published
+            max_buffer_length: Buffered mode only. Events per partition
+                that trigger a publish
+            compress: Deflate each event body (zlib) and mark it with a
+                "content-encoding": "deflate" property for consumers
+        """
         self.connection_string = connection_string or os.environ.get('EVENT_HUB_CONNECTION_STR')
         self.eventhub_name = eventhub_name or os.environ.get('EVENT_HUB_NAME')
 
         if not self.connection_string or not self.eventhub_name:
             raise ValueError("EVENT_HUB_CONNECTION_STR and EVENT_HUB_NAME must be set")
 
+        self.buffered = buffered
+        self.max_wait_time = max_wait_time
+        self.max_buffer_length = max_buffer_length
+        self.compress = compress
+
         self._producer = None
         self._stats = {
             "events_sent": 0,
             "batches_sent": 0,
             "errors": 0,
-            "start_time": datetime.now(timezone.utc)
+            "start_time": time.monotonic()
         }
 
     async def __aenter__(self):
@@ -77,17 +113,28 @@ class EventHubTranslationProducer:
     async def connect(self):
         """Initialize the Event Hub producer client"""
         try:
-            self._producer = EventHubProducerClient.from_connection_string(
-                conn_str=self.connection_string,
-                eventhub_name=self.eventhub_name
-            )
+            if self.buffered:
+                self._producer = EventHubProducerClient.from_connection_string(
+                    conn_str=self.connection_string,
+                    eventhub_name=self.eventhub_name,
+                    buffered_mode=True,
+                    on_success=self._on_buffered_success,
+                    on_error=self._on_buffered_error,
+                    max_wait_time=self.max_wait_time,
+                    max_buffer_length=self.max_buffer_length
+                )
+            else:
+                self._producer = EventHubProducerClient.from_connection_string(
+                    conn_str=self.connection_string,
+                    eventhub_name=self.eventhub_name
+                )
             logger.info(f"Connected to Event Hub: {self.eventhub_name}")
         except Exception as e:
             logger.error(f"Failed to connect to Event Hub: {e}")
             raise
 
     async def close(self):
-        """Close the producer connection"""
+        """Close the producer connection (buffered events are flushed first)"""
         if self._producer:
             await self._producer.close()
             logger.info("Event Hub connection closed")
@@ -95,27 +142,71 @@ class EventHubTranslationProducer:
 
     def _log_stats(self):
         """Log producer statistics"""
-        duration = (datetime.now(timezone.utc) - self._stats["start_time"]).total_seconds()
+        duration = time.monotonic() - self._stats["start_time"]
         logger.info(f"Session stats - Events: {self._stats['events_sent']}, "
                     f"Batches: {self._stats['batches_sent']}, "
                     f"Errors: {self._stats['errors']}, "
                     f"Duration: {duration:.2f}s")
 
+    def _encode_body(self, translation: TranslationEvent) -> bytes:
+        """Serialize a translation, compressing the body if enabled"""
+        body = translation.to_json_bytes()
+        return zlib.compress(body) if self.compress else body
+
+    def _to_event_data(self, body: bytes) -> EventData:
+        """Wrap an encoded body in EventData"""
+        event_data = EventData(body=body)
+        if self.compress:
+            event_data.properties = {"content-encoding": "deflate"}
+        return event_data
+
+    async def _on_buffered_success(self, events, partition_id):
+        """Buffered mode callback: a batch was published"""
+        self._stats["batches_sent"] += 1
+        self._stats["events_sent"] += len(events)
+        logger.info(f"Sent batch with {len(events)} events to partition {partition_id}")
+
+    async def _on_buffered_error(self, events, partition_id, error):
+        """Buffered mode callback: a batch failed to publish"""
+        self._stats["errors"] += 1
+        logger.error(f"Failed to send {len(events)} events to partition {partition_id}: {error}")
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def _send_batch_with_retry(self, batch):
         """Send batch with automatic retry on failure"""
         await self._producer.send_batch(batch)
 
     async def send_translation_event(self, translation: TranslationEvent):
-        """Send a single translation event"""
+        """
+        Send a single translation event
+
+        In buffered mode the event is only enqueued; the SDK publishes it
+        in the background once a batch fills or max_wait_time elapses.
+        """
+        if self.buffered:
+            if not self._producer:
+                raise RuntimeError("Producer not connected. Use async context manager or call connect()")
+
+            partition_key = f"{translation.source_language}-to-{translation.target_language}"
+            await self._producer.send_event(
+                self._to_event_data(self._encode_body(translation)),
+                partition_key=partition_key
+            )
+            return
+
         await self.send_translation_events([translation])
 
-    async def send_translation_events(self, translations: List[TranslationEvent]):
+    async def send_translation_events(self, translations: List[TranslationEvent],
+                                      concurrent_partitions: int = 1):
         """
         Send multiple translation events efficiently using batching
 
         Args:
             translations: List of TranslationEvent objects
+            concurrent_partitions: Split the events into this many shards and
+                send them concurrently without a partition key, so the service
+                spreads them over several partitions. Use for high-volume batch
+                jobs where per-language ordering does not matter.
         """
         if not self._producer:
             raise RuntimeError("Producer not connected. Use async context manager or call connect()")
@@ -124,39 +215,18 @@ class EventHubTranslationProducer:
             logger.warning("No translations to send")
             return
 
-        try:
-            # Create batch with partition key for better distribution
-            partition_key = f"{translations[0].source_language}-to-{translations[0].target_language}"
-            event_data_batch = await self._producer.create_batch(partition_key=partition_key)
-            events_in_current_batch = 0
-
+        if self.buffered:
             for translation in translations:
-                # Create event data (partition key is set on the batch, not individual events)
-                event_data = EventData(body=json.dumps(translation.to_dict()))
-
-                try:
-                    event_data_batch.add(event_data)
-                    events_in_current_batch += 1
-
-                except ValueError:  # Batch is full
-                    # Send current batch and create new one
-                    await self._send_batch_with_retry(event_data_batch)
-                    self._stats["batches_sent"] += 1
-                    self._stats["events_sent"] += events_in_current_batch
-
-                    logger.info(f"Sent batch with {events_in_current_batch} events")
-
-                    # Create new batch with same partition key and add the current event
-                    event_data_batch = await self._producer.create_batch(partition_key=partition_key)
-                    event_data_batch.add(event_data)
-                    events_in_current_batch = 1
+                await self.send_translation_event(translation)
+            return
 
-            # Send remaining events in the final batch
-            if events_in_current_batch > 0:
-                await self._send_batch_with_retry(event_data_batch)
-                self._stats["batches_sent"] += 1
-                self._stats["events_sent"] += events_in_current_batch
-                logger.info(f"Sent final batch with {events_in_current_batch} events")
+        try:
+            if concurrent_partitions > 1:
+                await self._send_shards(translations, concurrent_partitions)
+            else:
+                # Create batch with partition key for better distribution
+                partition_key = f"{translations[0].source_language}-to-{translations[0].target_language}"
+                await self._send_shard(translations, partition_key=partition_key)
 
             logger.info(f"Successfully sent {len(translations)} translation events")
 
@@ -169,6 +239,63 @@ class EventHubTranslationProducer:
             logger.error(f"Unexpected error sending events: {e}")
             raise
 
+    async def _send_shards(self, translations: List[TranslationEvent], shards: int):
+        """Send the events as concurrent shards without a partition key"""
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i in range(shards):
+                    shard = translations[i::shards]
+                    if shard:
+                        tg.create_task(self._send_shard(shard, partition_key=None))
+        except ExceptionGroup as eg:
+            # Surface the first shard's error itself (e.g. EventHubError), so
+            # callers see the same exception types as the single-shard path
+            raise eg.exceptions[0] from eg
+
+    async def _send_shard(self, translations: List[TranslationEvent], partition_key: Optional[str]):
+        """Send events as one or more batches, rolling over when a batch is full"""
+        event_data_batch = await self._producer.create_batch(partition_key=partition_key)
+        events_in_current_batch = 0
+        # The partition key is repeated in every event's annotations
+        overhead = EVENT_OVERHEAD_BYTES + len(partition_key.encode("utf-8") if partition_key else b"")
+
+        for translation in translations:
+            body = self._encode_body(translation)
+
+            # Roll over before adding when the event would not fit, rather than
+            # letting add() raise ValueError for a full batch
+            if (events_in_current_batch
+                    and event_data_batch.size_in_bytes + len(body) + overhead
+                    > event_data_batch.max_size_in_bytes):
+                await self._flush_batch(event_data_batch, events_in_current_batch)
+                event_data_batch = await self._producer.create_batch(partition_key=partition_key)
+                events_in_current_batch = 0
+
+            # Create event data (partition key is set on the batch, not individual events)
+            try:
+                event_data_batch.add(self._to_event_data(body))
+            except ValueError:
+                # The estimate fell short; roll over anyway. An event that
+                # doesn't fit in an empty batch can never be sent, so re-raise.
+                if not events_in_current_batch:
+                    raise
+                await self._flush_batch(event_data_batch, events_in_current_batch)
+                event_data_batch = await self._producer.create_batch(partition_key=partition_key)
+                event_data_batch.add(self._to_event_data(body))
+                events_in_current_batch = 0
+            events_in_current_batch += 1
+
+        # Send remaining events in the final batch
+        if events_in_current_batch > 0:
+            await self._flush_batch(event_data_batch, events_in_current_batch, final=True)
+
+    async def _flush_batch(self, event_data_batch, event_count: int, final: bool = False):
+        """Send a filled batch and record it in the stats"""
+        await self._send_batch_with_retry(event_data_batch)
+        self._stats["batches_sent"] += 1
+        self._stats["events_sent"] += event_count
+        logger.info(f"Sent {'final ' if final else ''}batch with {event_count} events")
+
 
 # ===========================================
 # FOR TESTING: Use the single_translation function
@@ -228,17 +355,62 @@ async def batch_translations():
         await producer.send_translation_events(translations)
 
 
+# Live utterances are coalesced into one batch per partition: a batch is
+# published once it holds LIVE_MAX_BUFFER_LENGTH events or LIVE_MAX_WAIT_TIME
+# seconds have passed, whichever comes first.
+LIVE_MAX_WAIT_TIME = 0.1
+LIVE_MAX_BUFFER_LENGTH = 50
+
+# Shared producer for live streaming, so every utterance reuses one AMQP link
+_live_producer: Optional[EventHubTranslationProducer] = None
+_live_producer_lock = asyncio.Lock()
+
+
+async def get_live_producer() -> EventHubTranslationProducer:
+    """Return the shared live producer, connecting it on first use"""
+    global _live_producer
+
+    if _live_producer is None:
+        async with _live_producer_lock:
+            if _live_producer is None:
+                producer = EventHubTranslationProducer(
+                    buffered=True,
+                    max_wait_time=LIVE_MAX_WAIT_TIME,
+                    max_buffer_length=LIVE_MAX_BUFFER_LENGTH
+                )
+                await producer.connect()
+                _live_producer = producer
+    return _live_producer
+
+
+async def close_live_producer():
+    """
+    Close the shared live producer.
+
+    Call this once when the streaming session ends (e.g. from a FastAPI
+    shutdown handler).
+    """
+    global _live_producer
+
+    async with _live_producer_lock:
+        if _live_producer is not None:
+            await _live_producer.close()
+            _live_producer = None
+
+
 async def send_live_translation(translation_event):
     """
     USE THIS FUNCTION FOR LIVE SPEECH STREAMING:
 
     Call this from your Speech SDK callbacks to send translations immediately.
-    Keep your Event Hub producer connection open during the session for efficiency.
+    Events are buffered and published in the background over one Event Hub
+    connection kept for the whole session; call close_live_producer() when
+    the session is over so the buffer gets flushed.
 
     """
     try:
-        async with EventHubTranslationProducer() as producer:
-            await producer.send_translation_event(translation_event)
+        producer = await get_live_producer()
+        await producer.send_translation_event(translation_event)
     except Exception as e:
         logger.error(f"Failed to send live translation: {e}")
 
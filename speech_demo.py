@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 import os
+import threading
 import azure.cognitiveservices.speech as speechsdk
 
 # Load variables from .env file
@@ -19,12 +20,36 @@ audio_config = speechsdk.audio.AudioConfig(filename="speech_sample.wav")
 speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config, audio_config=audio_config)
 print("recognizer initialized")
 
-# Recognize speech
-result = speech_recognizer.recognize_once()
-print("speech recognized")
+# Recognize speech continuously over one open session instead of
+# re-establishing the stream for every utterance with recognize_once()
+done = threading.Event()
 
-# Output result
-if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-    print("Recognized speech:", result.text)
-else:
-    print("Speech recognition failed:", result.reason)
+def on_recognizing(evt):
+    print("Recognizing:", evt.result.text)
+
+def on_recognized(evt):
+    if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
+        print("Recognized speech:", evt.result.text)
+    else:
+        print("Speech recognition failed:", evt.result.reason)
+
+failed = threading.Event()
+
+def on_canceled(evt):
+    # Reaching the end of the file also cancels; only report real errors
+    details = evt.cancellation_details
+    if details.reason == speechsdk.CancellationReason.Error:
+        print("Speech recognition failed:", details.reason, details.error_details)
+        failed.set()
+    done.set()
+
+speech_recognizer.recognizing.connect(on_recognizing)
+speech_recognizer.recognized.connect(on_recognized)
+speech_recognizer.session_stopped.connect(lambda evt: done.set())
+speech_recognizer.canceled.connect(on_canceled)
+
+speech_recognizer.start_continuous_recognition()
+done.wait()
+speech_recognizer.stop_continuous_recognition()
+if not failed.is_set():
+    print("speech recognized")
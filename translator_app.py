@@ -1,13 +1,21 @@
+import asyncio
+import functools
+import hashlib
 import os
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Set, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
-import requests
+import aiohttp
+import orjson
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from starlette.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
 # ------------ Setup ------------
 load_dotenv()
@@ -29,7 +37,69 @@ TRANSLATOR_ENDPOINT = getenv_any(
 TRANSLATOR_KEY   = getenv_any("AZURE_TRANSLATOR_KEY", "TRANSLATOR_KEY", default="")
 TRANSLATOR_REGION = getenv_any("AZURE_TRANSLATOR_REGION", "TRANSLATOR_REGION", default="")
 
-app = FastAPI()
+# Optional shared translation cache (e.g. redis://localhost:6379/0)
+REDIS_URL = os.getenv("REDIS_URL", "")
+# Look cached translations up by normalized text (case, width, whitespace and
+# trailing punctuation folded) for more hits. Off by default: a hit returns the
+# translation of whichever variant was cached first, so its casing and
+# punctuation may differ from what the current text would produce.
+TRANSLATION_CACHE_NORMALIZE = (
+    os.getenv("TRANSLATION_CACHE_NORMALIZE", "").lower() in ("1", "true", "yes")
+)
+
+# Max /ws connects per client address per 5 s; 0 (the default) disables the
+# limit. Only enable it where uvicorn sees real viewer addresses, i.e. it
+# trusts the proxy's X-Forwarded-For (--forwarded-allow-ips); otherwise every
+# viewer shares the proxy's address and one budget.
+WS_CONNECT_LIMIT = int(os.getenv("WS_CONNECT_LIMIT", "0"))
+
+# Fixed for the process lifetime, so build them once instead of per request.
+TRANSLATE_URL = f"{TRANSLATOR_ENDPOINT.rstrip('/')}/translate"
+TRANSLATE_HEADERS = {
+    "Ocp-Apim-Subscription-Key": TRANSLATOR_KEY,
+    "Ocp-Apim-Subscription-Region": TRANSLATOR_REGION,
+    "Content-Type": "application/json",
+}
+
+# One pooled HTTP session for the whole app (every outbound Azure call goes
+# through it) so calls reuse warm keep-alive connections and cached DNS
+# instead of doing DNS + TLS every request.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=200, limit_per_host=64, use_dns_cache=True,
+                                       ttl_dns_cache=300, keepalive_timeout=75),
+        timeout=aiohttp.ClientTimeout(total=10, sock_connect=3),
+    )
+    # index.html is static at runtime: read and hash it once, not per request.
+    app.state.index_bytes = INDEX_PATH.read_bytes() if INDEX_PATH.exists() else None
+    app.state.index_etag = (
+        f'"{hashlib.sha256(app.state.index_bytes).hexdigest()}"'
+        if app.state.index_bytes is not None else None
+    )
+    # Bounded so an unreachable Redis fails fast instead of waiting on the
+    # OS TCP timeouts; the read timeout must outlast RedisBus's blocking XREAD.
+    app.state.redis = aioredis.Redis.from_url(
+        REDIS_URL, socket_connect_timeout=2, socket_timeout=10,
+    ) if REDIS_URL else None
+    cache = TranslationCache(app.state.redis)
+    app.state.translator = TranslatorBatcher(app.state.http, cache=cache)
+    app.state.translator.start()
+    # With Redis available, /ws broadcasts reach clients on every worker.
+    app.state.bus = RedisBus(app.state.redis, broker) if app.state.redis is not None else None
+    if app.state.bus is not None:
+        app.state.bus.start()
+    try:
+        yield
+    finally:
+        if app.state.bus is not None:
+            await app.state.bus.close()
+        await app.state.translator.close()
+        await app.state.http.close()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS (keep permissive for now; tighten if you add a custom domain)
 app.add_middleware(
@@ -41,51 +111,278 @@ app.add_middleware(
 )
 
 # ------------ Helpers ------------
-def translate_sync(text: str, from_lang: str, to_lang: str) -> str:
-    """
-    Blocking call to Azure Translator Text REST API using 'requests'.
-    Returns translated text OR a friendly error string. Never raises.
-    """
-    if not text.strip():
-        return ""
+class TranslatorError(Exception):
+    """A Translator request failed; the message is safe to show to users."""
 
-    if not TRANSLATOR_KEY or not TRANSLATOR_REGION:
-        return ("Error: Translator service not configured. "
-                "Set AZURE_TRANSLATOR_KEY and AZURE_TRANSLATOR_REGION.")
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
 
-    url = f"{TRANSLATOR_ENDPOINT.rstrip('/')}/translate"
-    params = {"api-version": "3.0", "from": from_lang, "to": to_lang}
-    headers = {
-        "Ocp-Apim-Subscription-Key": TRANSLATOR_KEY,
-        "Ocp-Apim-Subscription-Region": TRANSLATOR_REGION,
-        "Content-Type": "application/json",
-    }
-    payload = [{"text": text}]
+@functools.lru_cache(maxsize=256)
+def translate_params(from_lang: Optional[str], to_lang: str) -> Tuple[Tuple[str, str], ...]:
+    """Query params for a language pair, built once per pair. A None source
+    language leaves "from" out so Translator detects it."""
+    if from_lang is None:
+        return (("api-version", "3.0"), ("to", to_lang))
+    return (("api-version", "3.0"), ("from", from_lang), ("to", to_lang))
+
+async def translate_batch_async(session: aiohttp.ClientSession, texts: List[str],
+                                from_lang: Optional[str], to_lang: str) -> List[str]:
+    """
+    Call Azure Translator Text REST API on the shared aiohttp session with
+    several texts in one request body (the API accepts up to 100).
+    Returns one translated text per input. Raises TranslatorError with a
+    friendly message if the request fails.
+    """
+    params = translate_params(from_lang, to_lang)
+    payload = orjson.dumps([{"text": text} for text in texts])
 
     try:
-        resp = requests.post(url, params=params, headers=headers, json=payload, timeout=10)
-        if resp.status_code != 200:
-            return f"Translation failed ({resp.status_code})"
-        data = resp.json()
+        async with session.post(TRANSLATE_URL, params=params,
+                                headers=TRANSLATE_HEADERS, data=payload) as resp:
+            if resp.status != 200:
+                raise TranslatorError(f"Translation failed ({resp.status})", resp.status)
+            data = orjson.loads(await resp.read())
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        raise TranslatorError(f"Translation failed: {type(e).__name__}") from e
+
+    results: List[str] = []
+    for i in range(len(texts)):
+        item = data[i] if isinstance(data, list) and i < len(data) else None
         translated: Optional[str] = (
-            data[0]["translations"][0]["text"]
-            if isinstance(data, list)
-            and data
-            and isinstance(data[0], dict)
-            and data[0].get("translations")
+            item["translations"][0]["text"]
+            if isinstance(item, dict) and item.get("translations")
             else ""
         )
-        return translated or ""
-    except requests.RequestException as e:
-        return f"Translation failed: {type(e).__name__}"
+        results.append(translated or "")
+    return results
+
+class TranslationCache:
+    """
+    Two-level translation cache so repeated phrases (responses, recurring
+    scripture lines) skip the Translator call: a per-process LRU holds the
+    hottest entries with no network I/O, in front of an optional shared
+    Redis that survives restarts and is shared across processes. Redis
+    errors and slow replies are treated as misses.
+    """
+
+    # Bump the version to invalidate every cached entry at once.
+    KEY_PREFIX = "mt:v1"
+    TTL_SECONDS = 60 * 60 * 24 * 14
+    L1_MAX = 2048
+    L1_TTL_SECONDS = 60 * 60 * 24
+    # A cache lookup is on the path of every miss; give up on Redis quickly.
+    REDIS_TIMEOUT = 0.5
+
+    def __init__(self, redis: Optional[aioredis.Redis] = None):
+        self._redis = redis
+        self._l1: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", text).lower().split()).rstrip(".!?,;:")
+
+    @classmethod
+    def key(cls, text: str, from_lang: Optional[str], to_lang: str) -> str:
+        if TRANSLATION_CACHE_NORMALIZE:
+            text = cls.normalize(text)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{cls.KEY_PREFIX}:{digest}:{from_lang or 'auto'}:{to_lang}"
+
+    def _l1_get(self, key: str) -> Optional[str]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        expires, translated = entry
+        if expires < time.monotonic():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return translated
+
+    def _l1_put(self, key: str, translated: str) -> None:
+        self._l1[key] = (time.monotonic() + self.L1_TTL_SECONDS, translated)
+        self._l1.move_to_end(key)
+        if len(self._l1) > self.L1_MAX:
+            self._l1.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        translated = self._l1_get(key)
+        if translated is not None or self._redis is None:
+            return translated
+
+        try:
+            cached = await asyncio.wait_for(self._redis.get(key), self.REDIS_TIMEOUT)
+        except (aioredis.RedisError, asyncio.TimeoutError):
+            return None
+        if cached is None:
+            return None
+
+        translated = cached.decode("utf-8")
+        self._l1_put(key, translated)
+        return translated
+
+    async def set(self, key: str, translated: str) -> None:
+        self._l1_put(key, translated)
+        if self._redis is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._redis.set(key, translated, ex=self.TTL_SECONDS),
+                                   self.REDIS_TIMEOUT)
+        except (aioredis.RedisError, asyncio.TimeoutError):
+            pass
+
+class TranslatorBatcher:
+    """
+    Coalesces concurrent translate calls into one Translator request.
+
+    Calls for the same language pair that arrive within ``window`` seconds
+    (up to ``max_items``) are sent as a single array body, and each caller
+    gets back its own item of the response. A group is split further if it
+    would exceed the API's per-request character limit. Concurrent calls for the same
+    text share one in-flight request instead of each queueing their own.
+    """
+
+    # Translator rejects a request whose texts total more than this.
+    MAX_CHARS = 50_000
+
+    def __init__(self, session: aiohttp.ClientSession,
+                 cache: Optional[TranslationCache] = None,
+                 window: float = 0.015, max_items: int = 100):
+        self._session = session
+        self._cache = cache
+        self._window = window
+        self._max_items = max_items
+        self._queue: "asyncio.Queue[Tuple[str, Optional[str], str, asyncio.Future]]" = asyncio.Queue()
+        self._runner: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def start(self) -> None:
+        self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        tasks = [t for t in (self._runner, *self._dispatches) if t]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def translate(self, text: str, from_lang: Optional[str], to_lang: str) -> str:
+        """Returns translated text OR a friendly error string. Never raises.
+        A None from_lang asks Translator to detect the source language."""
+        if not (isinstance(text, str) and isinstance(to_lang, str)
+                and (from_lang is None or isinstance(from_lang, str))):
+            return "Translation failed: text and to must be strings, from a string or null."
+
+        if not text.strip():
+            return ""
+
+        if not TRANSLATOR_KEY or not TRANSLATOR_REGION:
+            return ("Error: Translator service not configured. "
+                    "Set AZURE_TRANSLATOR_KEY and AZURE_TRANSLATOR_REGION.")
+
+        key = TranslationCache.key(text, from_lang, to_lang)
+        if self._cache is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Shielded so a caller that disconnects doesn't cancel the shared result.
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._queue.put_nowait((text, from_lang, to_lang, fut))
+        return await asyncio.shield(fut)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_items:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                self._schedule(batch)
+            except Exception as e:
+                # Never let one bad batch stop the runner: every later call
+                # would queue behind it and wait forever.
+                for *_, fut in batch:
+                    if not fut.done():
+                        fut.set_result(f"Translation failed: {type(e).__name__}")
+
+    def _schedule(self, batch: List[Tuple[str, Optional[str], str, asyncio.Future]]) -> None:
+        groups: Dict[Tuple[Optional[str], str], List[List[Tuple[str, asyncio.Future]]]] = {}
+        sizes: Dict[Tuple[Optional[str], str], int] = {}
+        for text, from_lang, to_lang, fut in batch:
+            pair = (from_lang, to_lang)
+            chunks = groups.setdefault(pair, [[]])
+            if chunks[-1] and sizes[pair] + len(text) > self.MAX_CHARS:
+                chunks.append([])
+                sizes[pair] = 0
+            chunks[-1].append((text, fut))
+            sizes[pair] = sizes.get(pair, 0) + len(text)
+
+        # Dispatch in the background so the next window starts collecting now.
+        for (from_lang, to_lang), chunks in groups.items():
+            for items in chunks:
+                task = asyncio.create_task(self._dispatch(from_lang, to_lang, items))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, from_lang: Optional[str], to_lang: str,
+                        items: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in items]
+        try:
+            results = await translate_batch_async(self._session, texts, from_lang, to_lang)
+        except TranslatorError as e:
+            if e.status == 400 and len(items) > 1:
+                # One unacceptable text rejects the whole array; retry the texts
+                # one at a time so only its own caller sees the error.
+                await asyncio.gather(*(
+                    self._dispatch(from_lang, to_lang, [item]) for item in items
+                ))
+                return
+            results = [str(e)] * len(items)
+            ok = False
+        except Exception as e:
+            # Anything unexpected must still resolve every caller: an unresolved
+            # future hangs its request and every later identical one joins it.
+            results = [f"Translation failed: {type(e).__name__}"] * len(items)
+            ok = False
+        else:
+            ok = True
+
+        for (_, fut), translated in zip(items, results):
+            if not fut.done():
+                fut.set_result(translated)
+
+        # Cache after answering, so a slow or failing Redis never delays callers.
+        if ok and self._cache is not None:
+            await asyncio.gather(*(
+                self._cache.set(TranslationCache.key(text, from_lang, to_lang), translated)
+                for text, translated in zip(texts, results) if translated
+            ), return_exceptions=True)
 
 # ------------ Routes ------------
 @app.get("/")
-async def get_index():
-    """Serve the SPA index with no-cache headers to avoid stale pages."""
-    if not INDEX_PATH.exists():
+async def get_index(request: Request):
+    """
+    Serve the SPA index from memory. `no-cache` (not `no-store`) makes the
+    browser revalidate every load, which its ETag answers with a bodyless 304.
+    """
+    if app.state.index_bytes is None:
         # Don’t 500 if index is missing; return a clear JSON message instead.
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": "index.html not found at application root."},
             status_code=404,
             headers={
@@ -94,64 +391,325 @@ async def get_index():
                 "Expires": "0",
             },
         )
-    return FileResponse(
-        INDEX_PATH,
-        headers={
-            "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        },
-    )
+    headers = {"ETag": app.state.index_etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == app.state.index_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=app.state.index_bytes, media_type="text/html", headers=headers)
+
+# Health probes hit this constantly; the body never changes, so encode it once.
+HEALTHZ_BODY = orjson.dumps({"ok": True})
 
 @app.get("/healthz")
 async def healthz():
     """Simple health check endpoint."""
-    return JSONResponse({"ok": True})
+    return Response(content=HEALTHZ_BODY, media_type="application/json")
 
 # ---- Translation API (Text REST, no server mic) ----
 @app.post("/api/translate")
-async def translate_text(request: dict):
+async def translate_text(request: Request):
     """
     Translate plain text using Azure Translator Text REST API.
-    Expects: {"text": "...", "from": "en", "to": "ko"}
+    Expects: {"text": "...", "from": "en", "to": "ko"}; "from": null auto-detects.
     """
-    text = (request or {}).get("text", "") or ""
-    from_lang = (request or {}).get("from", "en")
-    to_lang = (request or {}).get("to", "ko")
+    # Parse with orjson directly rather than through FastAPI's stdlib-json body.
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        body = None
+    if not isinstance(body, dict):
+        return ORJSONResponse({"error": "Expected a JSON object body."}, status_code=400)
+
+    text = body.get("text", "") or ""
+    from_lang = body.get("from", "en")
+    to_lang = body.get("to", "ko")
+    if not (isinstance(text, str) and isinstance(to_lang, str)
+            and (from_lang is None or isinstance(from_lang, str))):
+        return ORJSONResponse({"error": "text and to must be strings, from a string or null."},
+                              status_code=400)
 
-    # Run blocking HTTP call in a thread to keep the event loop responsive.
-    translated = await run_in_threadpool(translate_sync, text, from_lang, to_lang)
+    translated = await app.state.translator.translate(text, from_lang, to_lang)
     return {"translation": translated}
 
 # ---- WebSocket Broadcasting ----
-# Keep a set of all connected clients in this process.
-clients: Set[WebSocket] = set()
+# Messages queued within this window are sent together as one JSON array frame.
+COALESCE_WINDOW = 0.02
+
+class Subscriber:
+    """
+    A connected /ws client with its own bounded outbound queue drained by a
+    writer task, so a broadcast never waits on a socket. If the queue fills
+    during a burst the client loses frames; if a send fails or times out, or
+    the queue fills while the socket is stuck, the client is disconnected
+    (1013) so the page reconnects instead of silently going quiet.
+    """
+
+    # One of these per connection, so skip the per-instance __dict__.
+    __slots__ = ("ws", "topic", "_broker", "queue", "sending", "task")
+
+    QUEUE_SIZE = 32
+    SEND_TIMEOUT = 5.0
+
+    def __init__(self, websocket: WebSocket, broker: "Broker", topic: str = ""):
+        self.ws = websocket
+        self.topic = topic
+        self._broker = broker
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.sending = False
+        self.task = asyncio.create_task(self._writer())
+
+    def offer(self, data: bytes) -> bool:
+        """
+        Queue data without waiting. Returns False if the queue is full and the
+        socket is blocked mid-send, i.e. the client can't keep up at all.
+        """
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            return not self.sending
+        return True
+
+    def close(self) -> None:
+        self.task.cancel()
+
+    async def _writer(self) -> None:
+        try:
+            while True:
+                batch = [await self.queue.get()]
+                await asyncio.sleep(COALESCE_WINDOW)
+                while not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                frame = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+                self.sending = True
+                await asyncio.wait_for(self.ws.send_bytes(frame), self.SEND_TIMEOUT)
+                self.sending = False
+        except Exception:
+            # Send failed or timed out: drop this client and close its socket.
+            self._broker.evict(self)
+
+class Broker:
+    """
+    In-process pub/sub hub for /ws. Subscribers join a topic (e.g. one per
+    service or language) and a message published to a topic is fanned out
+    only to that topic's queues, so publishing costs the size of the room,
+    not of every connection. Subscribers are keyed by id(websocket) so
+    joining and leaving are O(1).
+    """
+
+    # "Try again later": tells an evicted client to reconnect.
+    EVICT_CODE = 1013
+
+    def __init__(self):
+        self.rooms: Dict[str, Dict[int, Subscriber]] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    def subscribe(self, websocket: WebSocket, topic: str = "") -> Subscriber:
+        sub = Subscriber(websocket, self, topic)
+        self.rooms.setdefault(topic, {})[id(websocket)] = sub
+        return sub
+
+    def unsubscribe(self, websocket: WebSocket, topic: str = "") -> None:
+        room = self.rooms.get(topic)
+        if room is None:
+            return
+        sub = room.pop(id(websocket), None)
+        if sub is not None:
+            sub.close()
+        if not room:
+            del self.rooms[topic]
+
+    def publish(self, data: bytes, topic: str = "",
+                exclude: Optional[WebSocket] = None) -> None:
+        """
+        Queue data for every subscriber of `topic` except `exclude`.
+        `data` is already UTF-8 encoded so it is encoded once, not once per
+        client; it goes out as a binary frame that the page decodes.
+        """
+        slow = [
+            sub for sub in self.rooms.get(topic, {}).values()
+            if sub.ws is not exclude and not sub.offer(data)
+        ]
+        for sub in slow:
+            self.evict(sub)
+
+    def evict(self, sub: Subscriber) -> None:
+        """Drop a subscriber that can't keep up and close its socket in the background."""
+        self.unsubscribe(sub.ws, sub.topic)
+        task = asyncio.create_task(self._close(sub.ws))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=self.EVICT_CODE), Subscriber.SEND_TIMEOUT)
+        except Exception:
+            pass
+
+broker = Broker()
+
+class ConnectLimiter:
+    """
+    Caps how often one client address may (re)connect to /ws, so a page
+    stuck in a tight reconnect loop can't monopolise the accept path.
+    A limit of 0 allows everything. Addresses that have gone quiet are
+    swept once the table grows large.
+    """
+
+    WINDOW = 5.0
+    SWEEP_AT = 1024
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._recent: Dict[str, Deque[float]] = {}
+
+    def allow(self, host: str) -> bool:
+        if self.limit <= 0:
+            return True
+        now = time.monotonic()
+        if len(self._recent) > self.SWEEP_AT:
+            self._recent = {h: q for h, q in self._recent.items() if q[-1] > now - self.WINDOW}
+        recent = self._recent.setdefault(host, deque())
+        while recent and recent[0] <= now - self.WINDOW:
+            recent.popleft()
+        if len(recent) >= self.limit:
+            return False
+        recent.append(now)
+        return True
+
+connect_limiter = ConnectLimiter(WS_CONNECT_LIMIT)
+
+# First frame on every accepted /ws connection: the backoff the page should
+# use when it reconnects after a drop.
+HELLO_FRAME = orjson.dumps({
+    "type": "hello",
+    "reconnect": {"min_ms": 500, "max_ms": 15000, "jitter": 0.5},
+})
+
+class RedisBus:
+    """
+    Relays /ws broadcasts between workers (and hosts) through a Redis
+    stream. Each worker appends what its own clients send and tails the
+    stream, handing every entry to its local Broker. It uses a plain XREAD
+    rather than a consumer group, because every worker needs every message.
+    The stream is trimmed to roughly MAXLEN entries.
+    """
+
+    STREAM = "ws:bcast"
+    MAXLEN = 10_000
+    BLOCK_MS = 5000
+    # A caption that can't be appended this quickly goes out locally instead.
+    PUBLISH_TIMEOUT = 0.5
+
+    def __init__(self, redis: aioredis.Redis, broker: Broker):
+        self._redis = redis
+        self._broker = broker
+        # Tags this worker's entries so a sender doesn't get its own message back.
+        self._node = os.urandom(4).hex()
+        self._pump: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._pump = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._pump is not None:
+            self._pump.cancel()
+            await asyncio.gather(self._pump, return_exceptions=True)
+
+    async def publish(self, data: bytes, topic: str = "",
+                      sender: Optional[WebSocket] = None) -> None:
+        origin = f"{self._node}:{id(sender) if sender is not None else ''}"
+        try:
+            await asyncio.wait_for(
+                self._redis.xadd(self.STREAM, {"d": data, "t": topic, "o": origin},
+                                 maxlen=self.MAXLEN, approximate=True),
+                self.PUBLISH_TIMEOUT)
+        except (aioredis.RedisError, asyncio.TimeoutError):
+            # Redis is unreachable or stalled: still reach the clients on this worker.
+            self._broker.publish(data, topic, exclude=sender)
+
+    async def _run(self) -> None:
+        last_id = None
+        while True:
+            try:
+                if last_id is None:
+                    # Start after the newest entry instead of replaying history.
+                    newest = await self._redis.xrevrange(self.STREAM, count=1)
+                    last_id = newest[0][0] if newest else b"0-0"
+                streams = await self._redis.xread({self.STREAM: last_id},
+                                                  count=100, block=self.BLOCK_MS)
+            except aioredis.RedisError:
+                await asyncio.sleep(1)
+                continue
+            for _, entries in streams:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    try:
+                        self._deliver(fields)
+                    except (KeyError, ValueError, UnicodeDecodeError):
+                        # Not one of ours (e.g. a hand-written XADD); skip it.
+                        continue
+
+    def _deliver(self, fields: Dict[bytes, bytes]) -> None:
+        topic = fields[b"t"].decode("utf-8")
+        node, _, sender_id = fields[b"o"].decode("ascii").partition(":")
+        exclude = None
+        if node == self._node and sender_id:
+            sub = self._broker.rooms.get(topic, {}).get(int(sender_id))
+            exclude = sub.ws if sub is not None else None
+        self._broker.publish(fields[b"d"], topic, exclude=exclude)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
+    # Clients that don't pass ?topic= all share the default room.
+    topic = websocket.query_params.get("topic", "")
     await websocket.accept()
-    clients.add(websocket)
+    # See WS_CONNECT_LIMIT: behind an untrusted proxy this is the proxy's address.
+    host = websocket.client.host if websocket.client else ""
+    if not connect_limiter.allow(host):
+        await websocket.close(code=Broker.EVICT_CODE)
+        return
+    await websocket.send_bytes(HELLO_FRAME)
+    broker.subscribe(websocket, topic)
     try:
-        while True:
-            # Admin sends JSON: {"transcript": "...", "translation": "..."}
-            data = await websocket.receive_text()
-            # Broadcast to all *other* clients
-            dead: Set[WebSocket] = set()
-            for client in list(clients):
-                if client is websocket:
-                    continue
-                try:
-                    await client.send_text(data)
-                except Exception:
-                    dead.add(client)
-            for d in dead:
-                clients.discard(d)
-    except WebSocketDisconnect:
-        clients.discard(websocket)
+        # Admin sends JSON: {"transcript": "...", "translation": "..."}
+        # iter_text() ends cleanly when the client disconnects.
+        async for text in websocket.iter_text():
+            # Drop anything that isn't a JSON object: spliced into a coalesced
+            # array frame it would make viewers fail to parse the whole batch,
+            # and a bare array would be mistaken for a batch of messages.
+            # Checked before encoding so rejected frames are never copied.
+            try:
+                message = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(message, dict):
+                continue
+            data = text.encode("utf-8")
+            # Broadcast to all *other* clients on the same topic
+            if app.state.bus is not None:
+                await app.state.bus.publish(data, topic, sender=websocket)
+            else:
+                broker.publish(data, topic, exclude=websocket)
     except Exception:
-        clients.discard(websocket)
+        pass
+    finally:
+        broker.unsubscribe(websocket, topic)
 
 # Optional: allow running locally with python translator_app.py
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("translator_app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    try:
+        import uvloop  # noqa: F401  (ships with uvicorn[standard]; not available on Windows)
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    # Without REDIS_URL, /ws fan-out is per process: with more than one worker,
+    # viewers only see messages from an admin connected to the same worker.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run("translator_app:app", host="0.0.0.0", port=8000,
+                reload=workers == 1, workers=workers,
+                loop=loop, http="httptools", ws="websockets",
+                # Captions are short; refuse oversized frames at the protocol layer.
+                ws_max_size=65536,
+                # permessage-deflate: caption frames repeat the same keys,
+                # so they compress well, coalesced array frames especially.
+                ws_per_message_deflate=True)
\ No newline at end of file